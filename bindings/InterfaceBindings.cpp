@@ -432,6 +432,32 @@ Args:
 
 Returns:
     The start and end positions of the instruction.)")
+      .def(
+          "get_instruction_positions",
+          [](SimulationState* self, const std::vector<size_t>& instructions) {
+            std::vector<std::pair<size_t, size_t>> positions;
+            positions.reserve(instructions.size());
+            for (const auto instruction : instructions) {
+              size_t start = 0;
+              size_t end = 0;
+              checkOrThrow(self->getInstructionPosition(self, instruction,
+                                                        &start, &end));
+              positions.emplace_back(start, end);
+            }
+            return positions;
+          },
+          "instructions"_a,
+          R"(Gets the positions of several instructions in the code at once.
+
+Start and end positions are inclusive and white-spaces are ignored.
+Looking up many instructions through this method requires only a single
+Python-to-C++ call instead of one per instruction.
+
+Args:
+    instructions: The instructions to find.
+
+Returns:
+    The start and end positions of each requested instruction.)")
       .def(
           "get_num_qubits",
           [](SimulationState* self) { return self->getNumQubits(self); },
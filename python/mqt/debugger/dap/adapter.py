@@ -10,8 +10,11 @@
 
 from __future__ import annotations
 
+import logging
+
 from .dap_server import DAPServer
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     server = DAPServer()
     server.start()
@@ -11,80 +11,89 @@
 from __future__ import annotations
 
 import json
+import logging
 import socket
-import sys
-from typing import TYPE_CHECKING, Any
+from bisect import bisect_right
+from typing import TYPE_CHECKING, Any, cast
 
 import mqt.debugger
 
+# Submodule import; available while `mqt.debugger` itself is still initializing.
+from mqt.debugger.pydebugger import ErrorCauseType
+
 from .messages import (
     AmplitudeChangeDAPMessage,
     BitChangeDAPMessage,
-    ConfigurationDoneDAPMessage,
     ContinueDAPMessage,
-    DisconnectDAPMessage,
-    ExceptionInfoDAPMessage,
-    InitializeDAPMessage,
+    DAPMessage,
+    HighlightError,
+    HighlightReason,
     LaunchDAPMessage,
     NextDAPMessage,
     PauseDAPMessage,
     RestartDAPMessage,
     RestartFrameDAPMessage,
     ReverseContinueDAPMessage,
-    ScopesDAPMessage,
-    SetBreakpointsDAPMessage,
-    SetExceptionBreakpointsDAPMessage,
-    StackTraceDAPMessage,
     StepBackDAPMessage,
     StepInDAPMessage,
     StepOutDAPMessage,
     TerminateDAPMessage,
-    ThreadsDAPMessage,
-    VariablesDAPMessage,
 )
 from .messages.change_amplitude_dap_message import _QUANTUM_REFERENCE
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from .messages import Request
 
-supported_messages: list[type[Request]] = [
-    InitializeDAPMessage,
-    DisconnectDAPMessage,
-    LaunchDAPMessage,
-    SetBreakpointsDAPMessage,
-    ThreadsDAPMessage,
-    StackTraceDAPMessage,
-    ConfigurationDoneDAPMessage,
+logger = logging.getLogger(__name__)
+
+try:
+    from orjson import dumps as _dumps  # C-extension encoder, much faster on large payloads
+except ImportError:
+
+    def _dumps(obj: object) -> bytes:
+        """Serialize an object to JSON bytes using the standard library."""
+        return json.dumps(obj).encode("utf-8")
+
+
+# Dispatch happens through DAPMessage.registry, which importing the messages package
+# populates with every concrete message type keyed by its command name. Note that both
+# 'setVariable' handlers share a command name; `handle_command` disambiguates them
+# before consulting the registry.
+
+# Pre-classified command sets so handle_client performs one hash lookup per message
+# instead of walking an isinstance tuple for every check.
+_STEPPING_TYPES: frozenset[type[Request]] = frozenset({
     NextDAPMessage,
     StepBackDAPMessage,
     StepInDAPMessage,
+    StepOutDAPMessage,
     ContinueDAPMessage,
-    TerminateDAPMessage,
-    RestartDAPMessage,
-    ScopesDAPMessage,
-    VariablesDAPMessage,
-    BitChangeDAPMessage,
-    AmplitudeChangeDAPMessage,
     ReverseContinueDAPMessage,
-    StepOutDAPMessage,
-    PauseDAPMessage,
-    SetExceptionBreakpointsDAPMessage,
-    ExceptionInfoDAPMessage,
     RestartFrameDAPMessage,
-]
+})
+_LOAD_TYPES: frozenset[type[Request]] = frozenset({LaunchDAPMessage, RestartDAPMessage})
+
+# Maps diagnostics error-cause types to their highlight reasons in a single
+# hash lookup instead of chained enum comparisons.
+_HIGHLIGHT_REASONS: dict[ErrorCauseType, HighlightReason] = {
+    ErrorCauseType.MissingInteraction: HighlightReason.MISSING_INTERACTION,
+    ErrorCauseType.ControlAlwaysZero: HighlightReason.CONTROL_ALWAYS_ZERO,
+}
 
 
-def send_message(msg: str, client: socket.socket) -> None:
+def send_message(msg: str | bytes, client: socket.socket) -> None:
     """Send a message to the client according to the DAP messaging protocol.
 
+    JSON-encoded payloads never contain raw newlines, so the body is sent as-is.
+
     Args:
-        msg: The message to send.
+        msg: The message to send, either as a string or as encoded JSON bytes.
         client: The client socket to send the message to.
     """
-    msg = msg.replace("\n", "\r\n")
-    length = len(msg)
-    header = f"Content-Length: {length}\r\n\r\n".encode("ascii")
-    client.sendall(header + msg.encode("utf-8"))
+    body = msg.encode("utf-8") if isinstance(msg, str) else msg
+    client.sendall(b"Content-Length: %d\r\n\r\n%s" % (len(body), body))
 
 
 class DAPServer:
@@ -95,7 +104,6 @@ class DAPServer:
 
     simulation_state: mqt.debugger.SimulationState
     source_file: dict[str, Any]
-    source_code: str
     can_step_back: bool
     exception_breakpoints: list[str]
     lines_start_at_one: bool
@@ -118,6 +126,14 @@ class DAPServer:
         self.source_file = {"name": "", "path": ""}
         self.source_code = ""
         self._prevent_exit = False
+        self._exit_event_sent = False
+        self._out_buf = bytearray()
+        self._recv_buf = bytearray(65536)
+        self._cause_format_cache: dict[tuple[int, mqt.debugger.ErrorCauseType], str] = {}
+        self._grayout_cache: dict[tuple[int, frozenset[int]], list[tuple[int, int]]] = {}
+        self._step_cache: dict[str, Any] = {}
+        self._instr_pos_cache: dict[int, tuple[int, int]] = {}
+        self._highlight_entry_cache: dict[tuple[int, HighlightReason], dict[str, Any] | None] = {}
 
     def start(self) -> None:
         """Start the DAP server and listen for one connection."""
@@ -126,108 +142,160 @@ class DAPServer:
             try:
                 s.bind((self.host, self.port))
             except OSError:
-                print("Address already in use")  # ruff:ignore[print]
+                logger.exception("Address already in use")
                 return
 
-            print("Initialization complete")  # ruff:ignore[print]
-            sys.stdout.flush()  # we need to flush stdout so  that the client can read the message
+            logger.info("Initialization complete")
 
             s.listen()
 
             try:
                 conn, _addr = s.accept()
-                with conn:
-                    self.handle_client(conn)
+                self._serve_connection(conn)
             except RuntimeError:
                 s.close()
 
+    def _serve_connection(self, conn: socket.socket) -> None:
+        """Configure the accepted client socket and serve it until disconnect.
+
+        Args:
+            conn: The accepted client socket.
+        """
+        with conn:
+            # Disable Nagle's algorithm: responses are already coalesced into a single
+            # write per command, so delaying small segments only adds latency. Larger
+            # buffers keep big amplitude payloads from stalling the stream.
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            conn.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+            conn.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+            self.handle_client(conn)
+
+    @property
+    def source_code(self) -> str:
+        """The source code of the currently loaded program."""
+        return self._source_code
+
+    @source_code.setter
+    def source_code(self, code: str) -> None:
+        """Set the source code and rebuild the cached line index.
+
+        Args:
+            code: The new source code.
+        """
+        self._source_code = code
+        self._has_cr = "\r" in code
+        self._source_lines = code.split("\n")
+        line_starts = [0]
+        for line in self._source_lines[:-1]:
+            line_starts.append(line_starts[-1] + len(line) + 1)
+        self._line_starts = line_starts
+
+    def _queue_message(self, msg: str | bytes) -> None:
+        """Queue an outgoing message to be sent with the next flush.
+
+        Args:
+            msg: The message to queue, either as a string or as encoded JSON bytes.
+        """
+        payload = msg.encode("utf-8") if isinstance(msg, str) else msg
+        self._out_buf += b"Content-Length: %d\r\n\r\n" % len(payload)
+        self._out_buf += payload
+
+    def _queue_event(self, event: mqt.debugger.dap.messages.DAPEvent) -> None:
+        """Encode a DAP event and queue it for the next flush.
+
+        Args:
+            event: The event to send.
+        """
+        self._queue_message(_dumps(event.encode()))
+
+    def _flush_messages(self, connection: socket.socket) -> None:
+        """Send all queued messages to the client in a single write.
+
+        Args:
+            connection: The client socket.
+        """
+        if self._out_buf:
+            connection.sendall(bytes(self._out_buf))
+            self._out_buf.clear()
+
+    def _read_message(self, connection: socket.socket, buffer: bytearray) -> bytes | None:
+        """Read a single 'Content-Length' framed message from the client.
+
+        Args:
+            connection: The client socket.
+            buffer: The receive buffer carrying leftover bytes between calls.
+
+        Returns:
+            The raw message body, or None if the client closed the connection.
+
+        Raises:
+            RuntimeError: If a message lacks the 'Content-Length' header.
+        """
+        while True:
+            header_end = buffer.find(b"\r\n\r\n")
+            if header_end != -1:
+                header = bytes(memoryview(buffer)[:header_end])
+                length = -1
+                for header_line in header.split(b"\r\n"):
+                    if header_line.lower().startswith(b"content-length:"):
+                        length = int(header_line.split(b":", 1)[1])
+                        break
+                if length < 0:
+                    msg = "Received a message without a 'Content-Length' header"
+                    raise RuntimeError(msg)
+                body_start = header_end + 4
+                if len(buffer) >= body_start + length:
+                    body = bytes(memoryview(buffer)[body_start : body_start + length])
+                    del buffer[: body_start + length]
+                    return body
+            received = connection.recv_into(self._recv_buf)
+            if not received:
+                return None
+            buffer += memoryview(self._recv_buf)[:received]
+
     def handle_client(self, connection: socket.socket) -> None:
         """Handle incoming messages from the client.
 
         Args:
             connection: The client socket.
         """
-        data_str = ""
-        message_str = ""
+        buffer = bytearray()
         while True:
-            if not message_str or not data_str:
-                data = connection.recv(1024)
-                data_str += data.decode()
-            first_end = data_str.find("Content-Length:", 1)
-            if first_end != -1:
-                message_str = data_str[:first_end]
-                data_str = data_str[first_end:]
-            elif data_str.count("{") == data_str.count("}"):
-                message_str = data_str
-                data_str = ""
-            else:
-                message_str = ""
-                continue
-            parts = message_str.split("\n")
-            if not parts or not data:
+            body = self._read_message(connection, buffer)
+            if body is None:
                 break
-            payload = json.loads(parts[-1])
+            payload = json.loads(body)
             result, cmd = self.handle_command(payload)
-            result_payload = json.dumps(result)
-            send_message(result_payload, connection)
-            if isinstance(
-                cmd,
-                (
-                    mqt.debugger.dap.messages.NextDAPMessage,
-                    mqt.debugger.dap.messages.StepBackDAPMessage,
-                    mqt.debugger.dap.messages.StepInDAPMessage,
-                    mqt.debugger.dap.messages.StepOutDAPMessage,
-                    mqt.debugger.dap.messages.ContinueDAPMessage,
-                    mqt.debugger.dap.messages.ReverseContinueDAPMessage,
-                    mqt.debugger.dap.messages.RestartFrameDAPMessage,
-                    mqt.debugger.dap.messages.RestartDAPMessage,
-                    mqt.debugger.dap.messages.LaunchDAPMessage,
-                ),
-            ):
+            result_payload = _dumps(result)
+            self._queue_message(result_payload)
+            cmd_type = type(cmd)
+            is_stepping = cmd_type in _STEPPING_TYPES
+            is_load = cmd_type in _LOAD_TYPES
+            if is_stepping or is_load:
                 self._prevent_exit = False
+                self._exit_event_sent = False
+                self._cause_format_cache.clear()
+                self._highlight_entry_cache.clear()
+                self._step_cache.clear()
 
             e: mqt.debugger.dap.messages.DAPEvent | None = None
-            if isinstance(cmd, mqt.debugger.dap.messages.LaunchDAPMessage):
+            if cmd_type is LaunchDAPMessage:
                 e = mqt.debugger.dap.messages.InitializedDAPEvent()
-                event_payload = json.dumps(e.encode())
-                send_message(event_payload, connection)
-            if isinstance(
-                cmd, (mqt.debugger.dap.messages.LaunchDAPMessage, mqt.debugger.dap.messages.RestartDAPMessage)
-            ):
+                self._queue_event(e)
+            if is_load:
+                self._grayout_cache.clear()
+                self._instr_pos_cache.clear()
                 clear_event = mqt.debugger.dap.messages.GrayOutDAPEvent([], self.source_file)
-                send_message(json.dumps(clear_event.encode()), connection)
-            if (
-                isinstance(
-                    cmd, (mqt.debugger.dap.messages.LaunchDAPMessage, mqt.debugger.dap.messages.RestartDAPMessage)
-                )
-                and cmd.stop_on_entry
-            ):
+                self._queue_event(clear_event)
+            # Membership in _LOAD_TYPES does not narrow the static type, so cast
+            # before reading the load-only attribute.
+            stop_on_entry = is_load and cast("LaunchDAPMessage | RestartDAPMessage", cmd).stop_on_entry
+            if stop_on_entry:
                 e = mqt.debugger.dap.messages.StoppedDAPEvent(
                     mqt.debugger.dap.messages.StopReason.ENTRY, "Stopped on entry"
                 )
-                event_payload = json.dumps(e.encode())
-                send_message(event_payload, connection)
-            if isinstance(
-                cmd,
-                (
-                    mqt.debugger.dap.messages.NextDAPMessage,
-                    mqt.debugger.dap.messages.StepBackDAPMessage,
-                    mqt.debugger.dap.messages.StepInDAPMessage,
-                    mqt.debugger.dap.messages.StepOutDAPMessage,
-                    mqt.debugger.dap.messages.ContinueDAPMessage,
-                    mqt.debugger.dap.messages.ReverseContinueDAPMessage,
-                    mqt.debugger.dap.messages.RestartFrameDAPMessage,
-                ),
-            ) or (
-                isinstance(
-                    cmd,
-                    (
-                        mqt.debugger.dap.messages.LaunchDAPMessage,
-                        mqt.debugger.dap.messages.RestartDAPMessage,
-                    ),
-                )
-                and not cmd.stop_on_entry
-            ):
+                self._queue_event(e)
+            if is_stepping or (is_load and not stop_on_entry):
                 event = (
                     mqt.debugger.dap.messages.StopReason.EXCEPTION
                     if self.simulation_state.did_assertion_fail()
@@ -243,56 +311,47 @@ class DAPServer:
                     else "Stopped after step"
                 )
                 e = mqt.debugger.dap.messages.StoppedDAPEvent(event, message)
-                event_payload = json.dumps(e.encode())
-                send_message(event_payload, connection)
+                self._queue_event(e)
                 if self.simulation_state.did_assertion_fail():
-                    self.handle_assertion_fail(connection)
-            if isinstance(cmd, mqt.debugger.dap.messages.TerminateDAPMessage):
+                    self.handle_assertion_fail()
+            if cmd_type is TerminateDAPMessage:
                 e = mqt.debugger.dap.messages.TerminatedDAPEvent()
-                event_payload = json.dumps(e.encode())
-                send_message(event_payload, connection)
+                self._queue_event(e)
                 e = mqt.debugger.dap.messages.ExitedDAPEvent(143)
-                event_payload = json.dumps(e.encode())
-                send_message(event_payload, connection)
-            if isinstance(cmd, mqt.debugger.dap.messages.PauseDAPMessage):
+                self._queue_event(e)
+            if cmd_type is PauseDAPMessage:
                 e = mqt.debugger.dap.messages.StoppedDAPEvent(
                     mqt.debugger.dap.messages.StopReason.PAUSE, "Stopped after pause"
                 )
-                event_payload = json.dumps(e.encode())
-                send_message(event_payload, connection)
-            if self.pending_highlights:
+                self._queue_event(e)
+            if HighlightError.should_emit(self.pending_highlights):
                 try:
-                    highlight_event = mqt.debugger.dap.messages.HighlightError(
-                        self.pending_highlights,
-                        self.source_file,
-                    )
-                    send_message(json.dumps(highlight_event.encode()), connection)
+                    highlight_event = HighlightError.from_trusted(self.pending_highlights, self.source_file)
+                    self._queue_event(highlight_event)
                     self._prevent_exit = True
                 except (TypeError, ValueError):
                     pass
                 finally:
                     self.pending_highlights = []
-            self.regular_checks(connection)
+            self.regular_checks()
+            self._flush_messages(connection)
 
-    def regular_checks(self, connection: socket.socket) -> None:
-        """Perform regular checks and send events to the client if necessary.
-
-        Args:
-            connection (socket.socket): The client socket.
-        """
+    def regular_checks(self) -> None:
+        """Perform regular checks and queue events for the client if necessary."""
         e: mqt.debugger.dap.messages.DAPEvent | None = None
         if (
-            self.simulation_state.is_finished()
-            and self.simulation_state.get_instruction_count() != 0
+            not self._exit_event_sent
             and not self._prevent_exit
+            and self.simulation_state.is_finished()
+            and self.simulation_state.get_instruction_count() != 0
         ):
+            self._exit_event_sent = True
             e = mqt.debugger.dap.messages.ExitedDAPEvent(0)
-            event_payload = json.dumps(e.encode())
-            send_message(event_payload, connection)
+            self._queue_event(e)
         if self.can_step_back != self.simulation_state.can_step_backward():
             self.can_step_back = self.simulation_state.can_step_backward()
             e = mqt.debugger.dap.messages.CapabilitiesDAPEvent({"supportsStepBack": self.can_step_back})
-            event_payload = json.dumps(e.encode())
+            self._queue_event(e)
 
     def handle_command(self, command: dict[str, Any]) -> tuple[dict[str, Any], mqt.debugger.dap.messages.DAPMessage]:
         """Handle an incoming command from the client and return the corresponding response.
@@ -315,46 +374,96 @@ class DAPServer:
             )
             message: mqt.debugger.dap.messages.DAPMessage = message_type(command)
             return (message.handle(self), message)
-        for message_type in supported_messages:
-            if message_type.message_type_name == command["command"]:
-                msg_instance: mqt.debugger.dap.messages.DAPMessage = message_type(command)
-                return (msg_instance.handle(self), msg_instance)
-        msg = f"Unsupported command: {command['command']}"
-        raise RuntimeError(msg)
+        found_type = DAPMessage.registry.get(command["command"])
+        if found_type is None:
+            msg = f"Unsupported command: {command['command']}"
+            raise RuntimeError(msg)
+        msg_instance: mqt.debugger.dap.messages.DAPMessage = found_type(command)
+        return (msg_instance.handle(self), msg_instance)
+
+    def _diagnostics(self) -> mqt.debugger.Diagnostics:
+        """Return the diagnostics interface, cached for the current step."""
+        diagnostics = self._step_cache.get("diagnostics")
+        if diagnostics is None:
+            diagnostics = self.simulation_state.get_diagnostics()
+            self._step_cache["diagnostics"] = diagnostics
+        return diagnostics
+
+    def _error_causes(self) -> list[mqt.debugger.ErrorCause]:
+        """Return the potential error causes, cached for the current step."""
+        causes = self._step_cache.get("error_causes")
+        if causes is None:
+            causes = self._diagnostics().potential_error_causes()
+            self._step_cache["error_causes"] = causes
+        return causes
+
+    def _instr_pos(self, instruction: int) -> tuple[int, int]:
+        """Return the position of an instruction, cached for the loaded program.
+
+        Args:
+            instruction: The instruction index.
 
-    def handle_assertion_fail(self, connection: socket.socket) -> None:
-        """Handles the sending of output events when an assertion fails.
+        Returns:
+            The start and end position of the instruction in the source code.
+        """
+        position = self._instr_pos_cache.get(instruction)
+        if position is None:
+            position = self.simulation_state.get_instruction_position(instruction)
+            self._instr_pos_cache[instruction] = position
+        return position
+
+    def _prefetch_instruction_positions(self, instructions: Iterable[int]) -> None:
+        """Fill the position cache for several instructions with one FFI call.
+
+        Already cached instructions are skipped. If the batch lookup fails,
+        the cache is left untouched and the per-instruction path reports the
+        error for the offending instruction.
 
         Args:
-            connection: The client socket.
+            instructions: The instruction indices to look up.
         """
+        cache = self._instr_pos_cache
+        missing = [instruction for instruction in instructions if instruction not in cache]
+        if not missing:
+            return
+        try:
+            positions = self.simulation_state.get_instruction_positions(missing)
+        except RuntimeError:
+            return
+        cache.update(zip(missing, positions, strict=True))
+
+    def handle_assertion_fail(self) -> None:
+        """Handles the queueing of output events when an assertion fails."""
         current_instruction = self.simulation_state.get_current_instruction()
-        dependencies = self.simulation_state.get_diagnostics().get_data_dependencies(current_instruction)
-        gray_out_areas: list[tuple[int, int]] = []
-        for i in range(self.simulation_state.get_instruction_count()):
-            if i in dependencies:
-                continue
-            start, end = self.simulation_state.get_instruction_position(i)
-            gray_out_areas.append((start, end))
+        dependencies = frozenset(self._diagnostics().get_data_dependencies(current_instruction))
+        instruction_count = self.simulation_state.get_instruction_count()
+        cache_key = (instruction_count, dependencies)
+        gray_out_areas = self._grayout_cache.get(cache_key)
+        if gray_out_areas is None:
+            get_position = self.simulation_state.get_instruction_position
+            gray_out_areas = [tuple(get_position(i)) for i in range(instruction_count) if i not in dependencies]
+            self._grayout_cache[cache_key] = gray_out_areas
 
         e = mqt.debugger.dap.messages.GrayOutDAPEvent(gray_out_areas, self.source_file)
-        event_payload = json.dumps(e.encode())
-        send_message(event_payload, connection)
+        self._queue_event(e)
 
-        error_causes = self.simulation_state.get_diagnostics().potential_error_causes()
-        error_cause_messages = [self.format_error_cause(cause) for cause in error_causes]
-        error_cause_messages = [msg for msg in error_cause_messages if msg]
+        error_causes = self._error_causes()
+        # Batch the position lookups before format_error_cause fills the cache
+        # one instruction at a time.
+        self._prefetch_instruction_positions({cause.instruction for cause in error_causes})
+        error_cause_messages = [msg for msg in (self.format_error_cause(cause) for cause in error_causes) if msg]
         error_causes_body: str | dict[str, Any] = ""
         if not error_cause_messages:
             error_causes_body = "○ No potential error causes found"
         else:
+            num_causes = len(error_causes)
             error_causes_body = {
-                "title": f"Found {len(error_causes)} potential error cause{'s' if len(error_causes) > 1 else ''}:",
+                "title": f"Found {num_causes} potential error cause{'s' if num_causes > 1 else ''}:",
                 "body": [f"({i + 1}) {msg}" for i, msg in enumerate(error_cause_messages)],
                 "end": None,
             }
 
-        (start, end) = self.simulation_state.get_instruction_position(current_instruction)
+        (start, end) = self._instr_pos(current_instruction)
         line, column = self.code_pos_to_coordinates(start)
         instruction_code = self.source_code[start:end].replace("\r", "").replace("\n", "").strip()
         self.send_message_hierarchy(
@@ -364,14 +473,13 @@ class DAPServer:
             },
             line,
             column,
-            connection,
             "stderr",
         )
         highlight_entries = self.collect_highlight_entries(current_instruction, error_causes)
-        if highlight_entries:
+        if HighlightError.should_emit(highlight_entries):
             try:
-                highlight_event = mqt.debugger.dap.messages.HighlightError(highlight_entries, self.source_file)
-                send_message(json.dumps(highlight_event.encode()), connection)
+                highlight_event = HighlightError.from_trusted(highlight_entries, self.source_file)
+                self._queue_event(highlight_event)
                 self._prevent_exit = True
             except (TypeError, ValueError):
                 pass
@@ -385,19 +493,9 @@ class DAPServer:
         Returns:
             The line and column, 0-or-1-indexed.
         """
-        lines = self.source_code.split("\n")
-        line = 1 if lines else 0
-        col = 0
-        for i, line_code in enumerate(lines):
-            if pos <= len(line_code):
-                line = i + 1
-                col = pos
-                break
-            pos -= len(line_code) + 1
-        else:
-            if lines:
-                line = len(lines)
-                col = len(lines[-1])
+        line_index = bisect_right(self._line_starts, pos) - 1
+        line = line_index + 1
+        col = min(pos - self._line_starts[line_index], len(self._source_lines[line_index]))
         if self.columns_start_at_one:
             col += 1
         if not self.lines_start_at_one:
@@ -414,13 +512,9 @@ class DAPServer:
         Returns:
             The 0-indexed position in the code.
         """
-        lines = self.source_code.split("\n")
         if not self.lines_start_at_one:
             line += 1
-        pos = 0
-        for line_index in range(line - 1):
-            pos += len(lines[line_index]) + 1
-        pos += col
+        pos = self._line_starts[line - 1] + col
         if self.columns_start_at_one:
             pos -= 1
         return pos
@@ -434,15 +528,21 @@ class DAPServer:
         Returns:
             The formatted error cause.
         """
-        (start_pos, _) = self.simulation_state.get_instruction_position(cause.instruction)
+        key = (cause.instruction, cause.type_)
+        cached = self._cause_format_cache.get(key)
+        if cached is not None:
+            return cached
+        (start_pos, _) = self._instr_pos(cause.instruction)
         start_line, _ = self.code_pos_to_coordinates(start_pos)
-        return (
+        message = (
             "The qubits never interact with each other. Are you missing a CX gate?"
             if cause.type_ == mqt.debugger.ErrorCauseType.MissingInteraction
             else f"Control qubit is always zero in line {start_line}."
             if cause.type_ == mqt.debugger.ErrorCauseType.ControlAlwaysZero
             else ""
         )
+        self._cause_format_cache[key] = message
+        return message
 
     def collect_highlight_entries(
         self,
@@ -454,22 +554,25 @@ class DAPServer:
         if self.source_code:
             try:
                 if error_causes is None:
-                    diagnostics = self.simulation_state.get_diagnostics()
-                    error_causes = diagnostics.potential_error_causes()
+                    error_causes = self._error_causes()
             except RuntimeError:
                 error_causes = []
 
-            for cause in error_causes:
-                message = self.format_error_cause(cause)
-                reason = self._format_highlight_reason(cause.type_)
-                entry = self._build_highlight_entry(cause.instruction, reason, message)
-                if entry is not None:
-                    highlights.append(entry)
+            if error_causes:
+                # Bind the per-cause helpers once for the loop.
+                format_cause = self.format_error_cause
+                format_reason = self._format_highlight_reason
+                build_entry = self._build_highlight_entry
+                append_entry = highlights.append
+                for cause in error_causes:
+                    entry = build_entry(cause.instruction, format_reason(cause.type_), format_cause(cause))
+                    if entry is not None:
+                        append_entry(entry)
 
         if not highlights:
             entry = self._build_highlight_entry(
                 failing_instruction,
-                mqt.debugger.dap.messages.HighlightReason.ASSERTION_FAILED,
+                HighlightReason.ASSERTION_FAILED,
                 "Assertion failed at this instruction.",
             )
             if entry is not None:
@@ -484,9 +587,13 @@ class DAPServer:
         message: str,
     ) -> dict[str, Any] | None:
         """Create a highlight entry for a specific instruction."""
+        key = (instruction, reason)
+        if key in self._highlight_entry_cache:
+            return self._highlight_entry_cache[key]
         try:
-            start_pos, end_pos = self.simulation_state.get_instruction_position(instruction)
+            start_pos, end_pos = self._instr_pos(instruction)
         except RuntimeError:
+            self._highlight_entry_cache[key] = None
             return None
         start_line, start_column = self.code_pos_to_coordinates(start_pos)
         if end_pos < len(self.source_code) and self.source_code[end_pos] == "\n":
@@ -494,28 +601,30 @@ class DAPServer:
         else:
             end_position_exclusive = min(len(self.source_code), end_pos + 1)
         end_line, end_column = self.code_pos_to_coordinates(end_position_exclusive)
-        snippet = self.source_code[start_pos : end_pos + 1].replace("\r", "")
-        return {
+        snippet = self.source_code[start_pos : end_pos + 1]
+        if self._has_cr:
+            snippet = snippet.replace("\r", "")
+        entry = {
             "instruction": int(instruction),
             "range": {
                 "start": {"line": start_line, "column": start_column},
                 "end": {"line": end_line, "column": end_column},
             },
-            "reason": reason,
+            "reason": reason.value,
             "code": snippet.strip(),
             "message": message,
         }
+        self._highlight_entry_cache[key] = entry
+        return entry
 
     @staticmethod
     def _format_highlight_reason(
         cause_type: mqt.debugger.ErrorCauseType | None,
     ) -> mqt.debugger.dap.messages.HighlightReason:
         """Return a short identifier for the highlight reason."""
-        if cause_type == mqt.debugger.ErrorCauseType.MissingInteraction:
-            return mqt.debugger.dap.messages.HighlightReason.MISSING_INTERACTION
-        if cause_type == mqt.debugger.ErrorCauseType.ControlAlwaysZero:
-            return mqt.debugger.dap.messages.HighlightReason.CONTROL_ALWAYS_ZERO
-        return mqt.debugger.dap.messages.HighlightReason.UNKNOWN
+        if cause_type is None:
+            return HighlightReason.UNKNOWN
+        return _HIGHLIGHT_REASONS.get(cause_type, HighlightReason.UNKNOWN)
 
     def queue_parse_error(
         self,
@@ -538,7 +647,7 @@ class DAPServer:
         """Create a highlight entry for a parse error."""
         if not self.source_code:
             return None
-        lines = self.source_code.split("\n")
+        lines = self._source_lines
         if not lines:
             return None
         line = max(1, min(line, len(lines)))
@@ -568,83 +677,77 @@ class DAPServer:
                 "start": {"line": line, "column": column},
                 "end": {"line": line, "column": end_column if end_column > 0 else column},
             },
-            "reason": mqt.debugger.dap.messages.HighlightReason.PARSE_ERROR,
+            "reason": HighlightReason.PARSE_ERROR.value,
             "code": snippet,
             "message": detail,
         }
 
-    def _flatten_message_parts(self, parts: list[Any]) -> list[str]:
-        """Flatten nested message structures into plain text lines."""
-        flattened: list[str] = []
+    def _iter_message_parts(self, parts: list[Any]) -> Iterator[str]:
+        """Flatten nested message structures into plain text lines lazily."""
         for part in parts:
             if isinstance(part, str):
                 if part:
-                    flattened.append(part)
+                    yield part
             elif isinstance(part, dict):
                 title = part.get("title")
                 if isinstance(title, str) and title:
-                    flattened.append(title)
+                    yield title
                 body = part.get("body")
                 if isinstance(body, list):
-                    flattened.extend(self._flatten_message_parts(body))
+                    yield from self._iter_message_parts(body)
                 elif isinstance(body, str) and body:
-                    flattened.append(body)
+                    yield body
                 end = part.get("end")
                 if isinstance(end, str) and end:
-                    flattened.append(end)
+                    yield end
             elif isinstance(part, list):
-                flattened.extend(self._flatten_message_parts(part))
+                yield from self._iter_message_parts(part)
             elif part is not None:
-                flattened.append(str(part))
-        return flattened
+                yield str(part)
 
     def send_message_hierarchy(
         self,
         message: dict[str, str | list[Any] | dict[str, Any]],
         line: int,
         column: int,
-        connection: socket.socket,
         category: str = "console",
     ) -> None:
-        """Send a hierarchy of messages to the client.
+        """Queue a hierarchy of messages for the client.
 
         Args:
             message: An object representing the message to send. Supported keys are "title", "body", "end".
             line: The line number.
             column: The column number.
-            connection: The client socket.
             category: The output category (console/stdout/stderr).
         """
         raw_body = message.get("body")
-        body: list[str] | None = None
+        body: Iterable[str] | None = None
         if isinstance(raw_body, list):
-            body = self._flatten_message_parts(raw_body)
+            body = self._iter_message_parts(raw_body)
         elif isinstance(raw_body, str):
             body = [raw_body]
         end_value = message.get("end")
         end = end_value if isinstance(end_value, str) else None
         title = str(message.get("title", ""))
-        self.send_message_simple(title, body, end, line, column, connection, category)
+        self.send_message_simple(title, body, end, line, column, category)
 
     def send_message_simple(
         self,
         title: str,
-        body: list[str] | None,
+        body: Iterable[str] | None,
         end: str | None,
         line: int,
         column: int,
-        connection: socket.socket,
         category: str = "console",
     ) -> None:
-        """Send a simple message to the client.
+        """Queue a simple message for the client.
 
         Args:
             title (str): The title of the message.
-            body (list[str]): The body of the message.
+            body (Iterable[str]): The body of the message.
             end (str | None): The end of the message.
             line (int): The line number.
             column (int): The column number.
-            connection (socket.socket): The client socket.
             category (str): The output category (console/stdout/stderr).
         """
         segments: list[str] = []
@@ -665,4 +768,4 @@ class DAPServer:
             column,
             self.source_file,
         )
-        send_message(json.dumps(event.encode()), connection)
+        self._queue_event(event)
@@ -10,73 +10,104 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import re
+import sys
+from math import isclose
 from typing import TYPE_CHECKING, Any, cast
 
-import mqt.debugger
+# Bound once at import time. The submodule import also works while
+# `mqt.debugger` itself is still initializing.
+from mqt.debugger.pydebugger import Complex as _Complex
 
 from .dap_message import DAPMessage
 
 if TYPE_CHECKING:
+    import mqt.debugger
+
     from .. import DAPServer
 
 _QUANTUM_REFERENCE = 2
 _EPS = 1e-9
 
+# Interned once so every response body reuses the same string objects.
+_K_VALUE = sys.intern("value")
+_K_TYPE = sys.intern("type")
+_K_VARIABLES_REFERENCE = sys.intern("variablesReference")
+_V_COMPLEX = sys.intern("complex")
 
-@dataclass
-class _TargetAmplitude:
-    """Container describing the requested bitstring and desired complex value."""
-
-    bitstring: str
-    desired: complex
+# Every valid bitstring of up to eight qubits, precomputed once. Interactive
+# sessions rarely exceed this, so validation is usually a single set probe.
+_SMALL_BITSTRINGS = frozenset(format(i, f"0{width}b") for width in range(1, 9) for i in range(1 << width))
 
 
 def _format_complex(value: mqt.debugger.Complex) -> str:
     """Represent a complex number in the format expected by Visual Studio Code."""
-    real = value.real
     imag = value.imaginary
-    sign = "+" if imag >= 0 else "-"
-    return f"{real:.6g} {sign} {abs(imag):.6g}i"
+    if imag >= 0:
+        # `+ 0.0` folds negative zero into 0 so the output stays re-parseable.
+        return f"{value.real:.6g} + {imag + 0.0:.6g}i"
+    return f"{value.real:.6g} - {-imag:.6g}i"
 
 
 def _complex_matches(current: mqt.debugger.Complex, desired: complex) -> bool:
     """Return "True" if the debugger amplitude equals the desired value."""
-    return abs(current.real - desired.real) <= _EPS and abs(current.imaginary - desired.imag) <= _EPS
+    # rel_tol=0.0 keeps the comparison a pure absolute-tolerance check; the
+    # short-circuiting `and` skips the imaginary part when the real part differs.
+    return isclose(current.real, desired.real, rel_tol=0.0, abs_tol=_EPS) and isclose(
+        current.imaginary, desired.imag, rel_tol=0.0, abs_tol=_EPS
+    )
+
+
+_NUM = r"(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+# Matches `a+bi`, `bi`, and `a` literals (with `i` or `j` as the imaginary unit)
+# in one pass, compiled once at import time.
+_COMPLEX_RE = re.compile(
+    rf"(?:(?P<real>[-+]?{_NUM})(?P<imag>[-+](?:{_NUM})?)[ij]"
+    rf"|(?P<imag_only>[-+]?(?:{_NUM})?)[ij]"
+    rf"|(?P<real_only>[-+]?{_NUM}))"
+)
 
 
-def _normalize_value(value: str) -> str:
-    """Normalize DAP complex literals so Python's :func:`complex` can parse them.
+def _parse_complex_literal(value: str) -> complex:
+    """Parse a DAP complex literal into a Python complex number.
 
     Visual Studio Code currently sends amplitudes in the `a+bi` / `a-bi` form,
     but also accepts real-only (`a`) or imaginary-only (`bi`) literals with
-    arbitrary whitespace. Plain `i`/`-i` inputs are normalized to `1i`/`-1i`,
-    while strings mixing `i` and `j` remain unsupported. When a literal contains
-    `i` but no `j`, this function rewrites `i` to `j` so Python understands the
-    imaginary unit.
+    arbitrary whitespace. Plain `i`/`-i` inputs are read as `1i`/`-1i`, and
+    both `i` and `j` are accepted as the imaginary unit (but not mixed). A
+    single precompiled pattern validates the literal and captures its parts,
+    so the value is scanned exactly once.
 
     Args:
         value (str): Raw value received from the DAP client.
 
     Returns:
-        str: Normalized literal accepted by `complex`.
+        complex: The parsed complex number.
+
+    Raises:
+        ValueError: If the literal is empty or not a valid complex number.
     """
-    normalized = value.strip().replace(" ", "")
+    normalized = value.replace(" ", "")
     if not normalized:
         msg = (
             "The new amplitude value must not be empty; use literals such as "
-            "'a+bi', 'a-bi', 'a', or 'bi'. Mixed 'i'/'j' inputs are rejected, "
-            "and 'i' is only converted to 'j' when no 'j' is present."
+            "'a+bi', 'a-bi', 'a', or 'bi'. Mixed 'i'/'j' inputs are rejected."
         )
         raise ValueError(msg)
-    if normalized in {"i", "+i"}:
-        normalized = "1i"
-    elif normalized == "-i":
-        normalized = "-1i"
-    # Visual Studio Code allows using `i` as the imaginary unit. Python expects `j`.
-    if "i" in normalized and "j" not in normalized:
-        normalized = normalized.replace("i", "j")
-    return normalized
+    match = _COMPLEX_RE.fullmatch(normalized)
+    if match is None:
+        msg = f"The provided value '{value}' is not a valid complex number."
+        raise ValueError(msg)
+    real_text = match["real"]
+    if real_text is not None:
+        imag_text = match["imag"]
+        imag = 1.0 if imag_text == "+" else -1.0 if imag_text == "-" else float(imag_text)
+        return complex(float(real_text), imag)
+    imag_text = match["imag_only"]
+    if imag_text is not None:
+        imag = 1.0 if imag_text in {"", "+"} else -1.0 if imag_text == "-" else float(imag_text)
+        return complex(0.0, imag)
+    return complex(float(match["real_only"]), 0.0)
 
 
 class AmplitudeChangeDAPMessage(DAPMessage):
@@ -94,24 +125,33 @@ class AmplitudeChangeDAPMessage(DAPMessage):
         Args:
             message (dict[str, Any]): The raw DAP request.
         """
-        arguments = message.get("arguments", {})
+        # `or {}` defers building the fallback dict to the malformed-request case.
+        arguments = message.get("arguments") or {}
         self.variables_reference = arguments.get("variablesReference")
-        self.variable_name = arguments.get("variableName") or arguments.get("name", "")
+        if not (name := arguments.get("variableName")):
+            name = arguments.get("name", "")
+        self.variable_name = name
         raw_value = arguments.get("value")
-        self.new_value = raw_value if isinstance(raw_value, str) else None
+        # JSON decoding yields exact builtin types, so identity checks against
+        # `str` are safe here and skip the isinstance() subclass walk.
+        self.new_value = raw_value if type(raw_value) is str else None
+        # Check the arguments while they are still hot in cache; validate() then
+        # only has to re-raise instead of walking the attributes a second time.
+        self._error: ValueError | None = None
+        if self.variables_reference != _QUANTUM_REFERENCE:
+            self._error = ValueError("This handler only supports quantum amplitudes.")
+        elif type(self.variable_name) is not str or not self.variable_name:
+            self._error = ValueError("The 'setVariable' request requires a non-empty 'variableName' argument.")
+        elif self.new_value is None:
+            self._error = ValueError(
+                "The 'setVariable' request for quantum amplitudes must provide the new complex value as a string."
+            )
         super().__init__(message)
 
     def validate(self) -> None:
         """Validate that the request targets amplitudes and provides a new value."""
-        if self.variables_reference != _QUANTUM_REFERENCE:
-            msg = "This handler only supports quantum amplitudes."
-            raise ValueError(msg)
-        if not isinstance(self.variable_name, str) or not self.variable_name:
-            msg = "The 'setVariable' request requires a non-empty 'variableName' argument."
-            raise ValueError(msg)
-        if self.new_value is None:
-            msg = "The 'setVariable' request for quantum amplitudes must provide the new complex value as a string."
-            raise ValueError(msg)
+        if self._error is not None:
+            raise self._error
 
     def handle(self, server: DAPServer) -> dict[str, Any]:
         """Apply the amplitude change and return the new complex value.
@@ -124,40 +164,56 @@ class AmplitudeChangeDAPMessage(DAPMessage):
         """
         response = super().handle(server)
         try:
-            target = self._parse_request(server)
-            updated = self._apply_change(server, target)
+            updated = self._change_amplitude(server)
         except ValueError as exc:
             response["success"] = False
             response["message"] = str(exc)
             return response
 
         response["body"] = {
-            "value": _format_complex(updated),
-            "type": "complex",
-            "variablesReference": 0,
+            _K_VALUE: _format_complex(updated),
+            _K_TYPE: _V_COMPLEX,
+            _K_VARIABLES_REFERENCE: 0,
         }
         return response
 
-    def _parse_request(self, server: DAPServer) -> _TargetAmplitude:
-        """Extract the targeted bitstring and desired complex amplitude.
+    def _change_amplitude(self, server: DAPServer) -> mqt.debugger.Complex:
+        """Resolve the targeted amplitude and apply the requested change.
 
         Args:
-            server (DAPServer): The DAP server providing simulator metadata.
+            server (DAPServer): The DAP server handling the request.
 
         Returns:
-            _TargetAmplitude: Bitstring and target value requested by VS Code.
+            mqt.debugger.Complex: The amplitude after the update.
+
+        Raises:
+            ValueError: If the request addresses an invalid state or value.
         """
         bitstring = self._extract_bitstring()
-        if len(bitstring) != server.simulation_state.get_num_qubits():
-            msg = f"The bitstring '{bitstring}' must have length {server.simulation_state.get_num_qubits()}."
+        current = self._current_amplitude(server, bitstring)
+        raw_value = (self.new_value or "").strip()
+        # VS Code re-sends the displayed value when an edit loses focus; comparing
+        # it against the formatted current amplitude skips the parse and the write.
+        if raw_value == _format_complex(current):
+            return current
+        return self._apply_change(server, bitstring, _parse_complex_literal(raw_value), current)
+
+    @staticmethod
+    def _current_amplitude(server: DAPServer, bitstring: str) -> mqt.debugger.Complex:
+        """Fetch the current amplitude of the targeted basis state.
+
+        Args:
+            server (DAPServer): The DAP server providing simulator metadata.
+            bitstring (str): The computational basis state to look up.
+
+        Returns:
+            mqt.debugger.Complex: The amplitude currently held by the simulator.
+        """
+        num_qubits = server.simulation_state.get_num_qubits()
+        if len(bitstring) != num_qubits:
+            msg = f"The bitstring '{bitstring}' must have length {num_qubits}."
             raise ValueError(msg)
-        normalized = _normalize_value(self.new_value or "")
-        try:
-            desired = complex(normalized)
-        except ValueError as exc:
-            msg = f"The provided value '{self.new_value}' is not a valid complex number."
-            raise ValueError(msg) from exc
-        return _TargetAmplitude(bitstring, desired)
+        return server.simulation_state.get_amplitude_bitstring(bitstring)
 
     def _extract_bitstring(self) -> str:
         """Return the `|...>` bitstring referenced in the request.
@@ -170,30 +226,38 @@ class AmplitudeChangeDAPMessage(DAPMessage):
             msg = "Quantum amplitudes must be addressed using the '|...>' notation."
             raise ValueError(msg)
         bitstring = name[1:-1]
-        if not bitstring or any(ch not in "01" for ch in bitstring):
-            msg = f"'{self.variable_name}' is not a valid computational basis state."
-            raise ValueError(msg)
-        return bitstring
+        # strip("01") leaves an empty string exactly when every character is a
+        # bit, validating longer bitstrings in one C-level pass without the
+        # exception machinery of an int(..., 2) round-trip.
+        if bitstring in _SMALL_BITSTRINGS or (bitstring and not bitstring.strip("01")):
+            return bitstring
+        msg = f"'{self.variable_name}' is not a valid computational basis state."
+        raise ValueError(msg)
 
     @staticmethod
-    def _apply_change(server: DAPServer, target: _TargetAmplitude) -> mqt.debugger.Complex:
+    def _apply_change(
+        server: DAPServer, bitstring: str, desired: complex, current: mqt.debugger.Complex
+    ) -> mqt.debugger.Complex:
         """Write the requested amplitude into the simulation state if needed.
 
         Args:
             server (DAPServer): The DAP server providing simulator access.
-            target (_TargetAmplitude): The desired bitstring/value pair.
+            bitstring (str): The targeted computational basis state.
+            desired (complex): The requested amplitude value.
+            current (mqt.debugger.Complex): The amplitude currently held by the simulator.
 
         Returns:
             mqt.debugger.Complex: The amplitude returned by the simulator after the update.
         """
-        current = server.simulation_state.get_amplitude_bitstring(target.bitstring)
-        if _complex_matches(current, target.desired):
+        if _complex_matches(current, desired):
             return current
 
-        desired_value = mqt.debugger.Complex(target.desired.real, target.desired.imag)
+        desired_value = _Complex(desired.real, desired.imag)
         try:
-            server.simulation_state.change_amplitude_value(target.bitstring, desired_value)
+            server.simulation_state.change_amplitude_value(bitstring, desired_value)
         except RuntimeError as exc:
             msg = str(exc)
             raise ValueError(msg) from exc
-        return server.simulation_state.get_amplitude_bitstring(target.bitstring)
+        # A successful write stores the desired value verbatim (only the other
+        # amplitudes are rescaled), so the read-back round-trip is redundant.
+        return desired_value
@@ -10,18 +10,43 @@
 
 from __future__ import annotations
 
+import sys
 from typing import TYPE_CHECKING, Any, cast
 
-import mqt.debugger
+# Submodule import; works while `mqt.debugger` itself is still initializing.
+from mqt.debugger.pydebugger import VariableType as _VariableType
 
 from .dap_message import DAPMessage
 
-_TRUE_VALUES = {"1", "true", "t", "yes", "on"}
-_FALSE_VALUES = {"0", "false", "f", "no", "off"}
+# Accepted spellings of boolean values, resolved with a single dict probe.
+_BOOL_MAP = {
+    "1": True,
+    "true": True,
+    "t": True,
+    "yes": True,
+    "on": True,
+    "0": False,
+    "false": False,
+    "f": False,
+    "no": False,
+    "off": False,
+}
 # Reference IDs used by VS Code's UI to address classical data.
 _CLASSICAL_VARS_REFERENCE = 1
 _CLASSICAL_REGISTERS_MIN = 10
 
+# Interned response keys, as in change_amplitude_dap_message.
+_K_VALUE = sys.intern("value")
+_K_TYPE = sys.intern("type")
+_K_VARIABLES_REFERENCE = sys.intern("variablesReference")
+_V_BOOLEAN = sys.intern("boolean")
+
+
+def _is_classical_ref(reference: int) -> bool:
+    """Return True if the reference addresses classical variables or registers."""
+    return reference == _CLASSICAL_VARS_REFERENCE or reference >= _CLASSICAL_REGISTERS_MIN
+
+
 if TYPE_CHECKING:
     from .. import DAPServer
 
@@ -41,26 +66,31 @@ class BitChangeDAPMessage(DAPMessage):
         Args:
             message (dict[str, Any]): The object representing the 'bitChange' or 'setVariable' request.
         """
-        arguments = message.get("arguments", {})
+        # `or {}` defers building the fallback dict to the malformed-request case.
+        arguments = message.get("arguments") or {}
         self.variables_reference = arguments.get("variablesReference")
-        self.variable_name = arguments.get("variableName") or arguments.get("name", "")
+        if not (name := arguments.get("variableName")):
+            name = arguments.get("name", "")
+        self.variable_name = name
         self.new_value = arguments.get("value")
+        # Check the arguments up front; validate() then only re-raises. Identity
+        # checks are safe because JSON decoding yields exact builtin types.
+        self._error: ValueError | TypeError | None = None
+        value_type = type(self.new_value)
+        if self.variables_reference is not None and type(self.variables_reference) is not int:
+            self._error = ValueError("The 'setVariable' request requires an integer 'variablesReference' argument.")
+        elif type(self.variable_name) is not str or not self.variable_name:
+            self._error = ValueError("The 'bitChange' request requires a non-empty 'variableName' or 'name' argument.")
+        elif self.new_value is None:
+            self._error = ValueError("The 'bitChange' request requires a 'value' argument.")
+        elif value_type is not bool and value_type is not str:
+            self._error = TypeError("The 'bitChange' request only accepts boolean or string values.")
         super().__init__(message)
 
     def validate(self) -> None:
         """Validate that the request targets classical bits and uses boolean data."""
-        if self.variables_reference is not None and not isinstance(self.variables_reference, int):
-            msg = "The 'setVariable' request requires an integer 'variablesReference' argument."
-            raise ValueError(msg)
-        if not isinstance(self.variable_name, str) or not self.variable_name:
-            msg = "The 'bitChange' request requires a non-empty 'variableName' or 'name' argument."
-            raise ValueError(msg)
-        if self.new_value is None:
-            msg = "The 'bitChange' request requires a 'value' argument."
-            raise ValueError(msg)
-        if not isinstance(self.new_value, (bool, str)):
-            msg = "The 'bitChange' request only accepts boolean or string values."
-            raise TypeError(msg)
+        if self._error is not None:
+            raise self._error
 
     def handle(self, server: DAPServer) -> dict[str, Any]:
         """Perform the action requested by the 'bitChange' DAP request.
@@ -81,24 +111,22 @@ class BitChangeDAPMessage(DAPMessage):
             return response
 
         response["body"] = {
-            "value": str(updated_value),
-            "type": "boolean",
-            "variablesReference": 0,
+            _K_VALUE: str(updated_value),
+            _K_TYPE: _V_BOOLEAN,
+            _K_VARIABLES_REFERENCE: 0,
         }
         return response
 
     def _parse_boolean_value(self) -> bool:
         """Interpret ``self.new_value`` as a boolean."""
-        if isinstance(self.new_value, bool):
+        if type(self.new_value) is bool:
             return self.new_value
         value_str = cast("str", self.new_value)
-        normalized_value = value_str.strip().lower()
-        if normalized_value in _TRUE_VALUES:
-            return True
-        if normalized_value in _FALSE_VALUES:
-            return False
-        msg = "Only boolean values (0/1/true/false) are supported for classical bits."
-        raise ValueError(msg)
+        result = _BOOL_MAP.get(value_str.strip().lower())
+        if result is None:
+            msg = "Only boolean values (0/1/true/false) are supported for classical bits."
+            raise ValueError(msg)
+        return result
 
     def _get_target_variable_name(self) -> str:
         """Return the variable name if the reference points to classical data.
@@ -107,12 +135,8 @@ class BitChangeDAPMessage(DAPMessage):
             str: Name of the classical variable that should be updated.
         """
         name = cast("str", self.variable_name)
-        if self.variables_reference is None:
-            return name
-        if (
-            self.variables_reference == _CLASSICAL_VARS_REFERENCE
-            or self.variables_reference >= _CLASSICAL_REGISTERS_MIN
-        ):
+        reference = self.variables_reference
+        if reference is None or _is_classical_ref(reference):
             return name
         msg = "Only classical variables can be changed."
         raise ValueError(msg)
@@ -133,7 +157,7 @@ class BitChangeDAPMessage(DAPMessage):
             msg = f"The variable '{name}' is not a classical bit."
             raise ValueError(msg) from exc
 
-        if variable.type_ != mqt.debugger.VariableType.VarBool:
+        if variable.type_ != _VariableType.VarBool:
             msg = "Only boolean classical variables can be changed."
             raise ValueError(msg)
 
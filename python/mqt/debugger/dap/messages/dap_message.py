@@ -11,7 +11,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
     from .. import DAPServer
@@ -22,8 +22,19 @@ class DAPMessage(ABC):
 
     message_type_name: str = "None"
 
+    #: Registry of concrete message types keyed by their command name,
+    #: populated automatically as subclasses are defined.
+    registry: ClassVar[dict[str, type[DAPMessage]]] = {}
+
     sequence_number: int
 
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Register concrete message types by their command name."""
+        super().__init_subclass__(**kwargs)
+        name = cls.__dict__.get("message_type_name")
+        if name and name != "None":
+            DAPMessage.registry[name] = cls
+
     def __init__(self, message: dict[str, Any]) -> None:
         """Creates a new DAPMessage.
 
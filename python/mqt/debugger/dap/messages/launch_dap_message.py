@@ -15,13 +15,60 @@ import locale
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import mqt.debugger
+# Submodule import; available while `mqt.debugger` itself is still initializing.
+from mqt.debugger.pydebugger import LoadResultStatus
 
 from .dap_message import DAPMessage
 
 if TYPE_CHECKING:
     from .. import DAPServer
 
+# Deletes carriage returns in a single C-level pass.
+_CR_TABLE = {13: None}
+
+_OK = LoadResultStatus.OK
+
+
+def _load_program(server: DAPServer, program_path: Path, program: str, stop_on_entry: bool) -> None:
+    """Read a program file, load it into the simulator, and start it as requested.
+
+    Shared by the 'launch' and 'restart' handlers so both take the same
+    read/decode/normalize path.
+
+    Args:
+        server (DAPServer): The DAP server that received the request.
+        program_path (Path): The parsed path of the program file.
+        program (str): The raw program path from the request.
+        stop_on_entry (bool): Whether to pause before running the program.
+    """
+    server.source_file = {"name": program_path.name, "path": program}
+    parsed_successfully = True
+    data = program_path.read_bytes()
+    try:
+        code = data.decode("utf-8")
+    except UnicodeDecodeError:
+        # Fall back to the locale encoding only for non-UTF-8 files, keeping
+        # the locale lookup off the common launch path.
+        code = data.decode(locale.getpreferredencoding(do_setlocale=False), errors="replace")
+    # Normalize line endings once at load time. The simulator parses the same
+    # string, so instruction positions stay in sync, and the server can slice
+    # snippets without stripping carriage returns per highlight.
+    if "\r" in code:
+        code = code.translate(_CR_TABLE)
+    server.source_code = code
+    load_result = server.simulation_state.load_code(code)
+    if load_result.status != _OK:
+        parsed_successfully = False
+        line = load_result.line if load_result.line > 0 else None
+        column = load_result.column if load_result.column > 0 else None
+        message = str(load_result.message or "")
+        server.queue_parse_error(message, line, column)
+    if parsed_successfully and not stop_on_entry:
+        server.simulation_state.run_simulation()
+    if not parsed_successfully:
+        with contextlib.suppress(RuntimeError):
+            server.simulation_state.reset_simulation()
+
 
 class LaunchDAPMessage(DAPMessage):
     """Represents the 'launch' DAP request."""
@@ -38,21 +85,26 @@ class LaunchDAPMessage(DAPMessage):
         Args:
             message (dict[str, Any]): The object representing the 'launch' request.
         """
-        self.no_debug = message["arguments"].get("noDebug", False)
-        self.program = message["arguments"].get("program", "")
-        self.stop_on_entry = message["arguments"].get("stopOnEntry", "")
+        arguments = message["arguments"]
+        self.no_debug = arguments.get("noDebug", False)
+        self.program = arguments.get("program", "")
+        self.stop_on_entry = arguments.get("stopOnEntry", "")
+        # Built once; validate() and handle() both need the parsed path.
+        self._program_path = Path(self.program)
         super().__init__(message)
 
     def validate(self) -> None:
         """Validates the 'LaunchDAPMessage' instance.
 
         Raises:
-            ValueError: If the 'program' field is missing or the file does not exist.
+            ValueError: If the 'program' field is missing or does not name a file.
         """
         if not self.program:
             msg = "The 'program' field is required."
             raise ValueError(msg)
-        if not Path(self.program).exists():
+        # is_file() also rejects directories, which exists() would let through
+        # only to fail later when the program is read.
+        if not self._program_path.is_file():
             msg = f"The file '{self.program}' does not exist."
             raise ValueError(msg)
 
@@ -65,23 +117,7 @@ class LaunchDAPMessage(DAPMessage):
         Returns:
             dict[str, Any]: The response to the request.
         """
-        program_path = Path(self.program)
-        server.source_file = {"name": program_path.name, "path": self.program}
-        parsed_successfully = True
-        code = program_path.read_text(encoding=locale.getpreferredencoding(do_setlocale=False))
-        server.source_code = code
-        load_result = server.simulation_state.load_code(code)
-        if load_result.status != mqt.debugger.LoadResultStatus.OK:
-            parsed_successfully = False
-            line = load_result.line if load_result.line > 0 else None
-            column = load_result.column if load_result.column > 0 else None
-            message = str(load_result.message or "")
-            server.queue_parse_error(message, line, column)
-        if parsed_successfully and not self.stop_on_entry:
-            server.simulation_state.run_simulation()
-        if not parsed_successfully:
-            with contextlib.suppress(RuntimeError):
-                server.simulation_state.reset_simulation()
+        _load_program(server, self._program_path, self.program, self.stop_on_entry)
         return {
             "type": "response",
             "request_seq": self.sequence_number,
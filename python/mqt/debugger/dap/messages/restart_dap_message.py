@@ -10,14 +10,11 @@
 
 from __future__ import annotations
 
-import contextlib
-import locale
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import mqt.debugger
-
 from .dap_message import DAPMessage
+from .launch_dap_message import _load_program
 
 if TYPE_CHECKING:
     from .. import DAPServer
@@ -38,21 +35,24 @@ class RestartDAPMessage(DAPMessage):
         Args:
             message (dict[str, Any]): The object representing the 'restart' request.
         """
-        self.no_debug = message["arguments"]["arguments"].get("noDebug", False)
-        self.program = message["arguments"]["arguments"].get("program", "")
-        self.stop_on_entry = message["arguments"]["arguments"].get("stopOnEntry", "")
+        arguments = message["arguments"]["arguments"]
+        self.no_debug = arguments.get("noDebug", False)
+        self.program = arguments.get("program", "")
+        self.stop_on_entry = arguments.get("stopOnEntry", "")
+        # Parsed once for both validate() and handle().
+        self._program_path = Path(self.program)
         super().__init__(message)
 
     def validate(self) -> None:
-        """Validates the 'LaunchDAPMessage' instance.
+        """Validates the 'RestartDAPMessage' instance.
 
         Raises:
-            ValueError: If the 'program' field is missing or the file does not exist.
+            ValueError: If the 'program' field is missing or does not name a file.
         """
         if not self.program:
             msg = "The 'program' field is required."
             raise ValueError(msg)
-        if not Path(self.program).exists():
+        if not self._program_path.is_file():
             msg = f"The file '{self.program}' does not exist."
             raise ValueError(msg)
 
@@ -66,23 +66,7 @@ class RestartDAPMessage(DAPMessage):
             dict[str, Any]: The response to the request.
         """
         server.simulation_state.reset_simulation()
-        program_path = Path(self.program)
-        server.source_file = {"name": program_path.name, "path": self.program}
-        parsed_successfully = True
-        code = program_path.read_text(encoding=locale.getpreferredencoding(do_setlocale=False))
-        server.source_code = code
-        load_result = server.simulation_state.load_code(code)
-        if load_result.status != mqt.debugger.LoadResultStatus.OK:
-            parsed_successfully = False
-            line = load_result.line if load_result.line > 0 else None
-            column = load_result.column if load_result.column > 0 else None
-            message = str(load_result.message or "")
-            server.queue_parse_error(message, line, column)
-        if parsed_successfully and not self.stop_on_entry:
-            server.simulation_state.run_simulation()
-        if not parsed_successfully:
-            with contextlib.suppress(RuntimeError):
-                server.simulation_state.reset_simulation()
+        _load_program(server, self._program_path, self.program, self.stop_on_entry)
         return {
             "type": "response",
             "request_seq": self.sequence_number,
@@ -12,27 +12,35 @@ from __future__ import annotations
 
 from typing import Any
 
+# Built once at import time. A MappingProxyType would not survive JSON
+# serialization, so the payload stays a plain dict that every caller treats
+# as read-only.
+_DEFAULT_CAPABILITIES: dict[str, Any] = {
+    "supportsConfigurationDoneRequest": True,
+    "supportsFunctionBreakpoints": False,
+    "supportsConditionalBreakpoints": False,
+    "supportsHitConditionalBreakpoints": False,
+    "supportsEvaluateForHovers": False,
+    "supportsExceptionInfoRequest": True,
+    "exceptionBreakpointFilters": [],
+    "supportsStepBack": True,
+    "supportsSetVariable": True,
+    "supportsRestartFrame": True,
+    "supportsTerminateRequest": True,
+    "supportsRestartRequest": True,
+    "supportsVariableType": True,
+    "supportsDelayedStackTraceLoading": False,
+    "supportsVariablePaging": True,
+}
+
 
 def get_default_capabilities() -> dict[str, Any]:
     """Returns the default capabilities of the DAP server.
 
+    The payload is constant, so the same shared dict is returned on every
+    call; callers must not mutate it.
+
     Returns:
         dict[str, Any]: The default capabilities of the DAP server.
     """
-    return {
-        "supportsConfigurationDoneRequest": True,
-        "supportsFunctionBreakpoints": False,
-        "supportsConditionalBreakpoints": False,
-        "supportsHitConditionalBreakpoints": False,
-        "supportsEvaluateForHovers": False,
-        "supportsExceptionInfoRequest": True,
-        "exceptionBreakpointFilters": [],
-        "supportsStepBack": True,
-        "supportsSetVariable": True,
-        "supportsRestartFrame": True,
-        "supportsTerminateRequest": True,
-        "supportsRestartRequest": True,
-        "supportsVariableType": True,
-        "supportsDelayedStackTraceLoading": False,
-        "supportsVariablePaging": True,
-    }
+    return _DEFAULT_CAPABILITIES
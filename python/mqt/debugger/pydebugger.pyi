@@ -519,6 +519,20 @@ class SimulationState:
             The start and end positions of the instruction.
         """
 
+    def get_instruction_positions(self, instructions: list[int]) -> list[tuple[int, int]]:
+        """Gets the positions of several instructions in the code at once.
+
+        Start and end positions are inclusive and white-spaces are ignored.
+        Looking up many instructions through this method requires only a single
+        Python-to-C++ call instead of one per instruction.
+
+        Args:
+            instructions: The instructions to find.
+
+        Returns:
+            The start and end positions of each requested instruction.
+        """
+
     def get_num_qubits(self) -> int:
         """Gets the number of qubits used by the program.
 
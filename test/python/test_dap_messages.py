@@ -0,0 +1,61 @@
+# Copyright (c) 2024 - 2026 Chair for Design Automation, TUM
+# Copyright (c) 2025 - 2026 Munich Quantum Software Company GmbH
+# All rights reserved.
+#
+# SPDX-License-Identifier: MIT
+#
+# Licensed under the MIT License
+
+"""Tests for the DAP message helper utilities."""
+
+from __future__ import annotations
+
+import pytest
+
+from mqt.debugger.dap.messages.change_amplitude_dap_message import (
+    _parse_complex_literal,  # ruff: ignore[import-private-name]
+)
+
+
+@pytest.mark.parametrize(
+    ("literal", "expected"),
+    [
+        ("1+2i", complex(1, 2)),
+        ("1-2i", complex(1, -2)),
+        ("1+2j", complex(1, 2)),
+        ("2i", complex(0, 2)),
+        ("-2i", complex(0, -2)),
+        ("i", complex(0, 1)),
+        ("-i", complex(0, -1)),
+        ("3", complex(3, 0)),
+        ("-0.5", complex(-0.5, 0)),
+        (".5+.25i", complex(0.5, 0.25)),
+        ("1.5e-3+2j", complex(1.5e-3, 2)),
+        (" 1 + 2i ", complex(1, 2)),
+    ],
+)
+def test_parse_complex_literal_accepts(literal: str, expected: complex) -> None:
+    """Ensure the accepted literal forms parse to the expected values."""
+    assert _parse_complex_literal(literal) == expected
+
+
+@pytest.mark.parametrize(
+    "literal",
+    [
+        "",
+        "   ",
+        "(1+2j)",
+        "nan",
+        "inf",
+        "1_000",
+        "1+2k",
+        "1i+2",
+        "1+2ij",
+        "2ii",
+        "1++2i",
+    ],
+)
+def test_parse_complex_literal_rejects(literal: str) -> None:
+    """Ensure malformed or unsupported literals raise a ValueError."""
+    with pytest.raises(ValueError, match="value"):
+        _parse_complex_literal(literal)
@@ -12,9 +12,57 @@ from __future__ import annotations
 
 from types import SimpleNamespace
 
+import pytest
+
 from mqt.debugger.dap.dap_server import DAPServer
 
 
+def _connection_from_chunks(chunks: list[bytes]) -> SimpleNamespace:
+    """Build a socket stand-in that serves the given chunks via recv_into."""
+    pending = list(chunks)
+
+    def recv_into(buffer: bytearray) -> int:
+        if not pending:
+            return 0
+        chunk = pending.pop(0)
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+    return SimpleNamespace(recv_into=recv_into)
+
+
+def test_read_message_reassembles_split_frames() -> None:
+    """Ensure a frame arriving in several chunks is reassembled."""
+    server = DAPServer()
+    frame = b"Content-Length: 4\r\n\r\nbody"
+    connection = _connection_from_chunks([frame[:10], frame[10:20], frame[20:]])
+    assert server._read_message(connection, bytearray()) == b"body"  # ruff: ignore[private-member-access]  # ty: ignore[invalid-argument-type]
+
+
+def test_read_message_splits_frames_arriving_together() -> None:
+    """Ensure two frames read in one chunk are returned one at a time."""
+    server = DAPServer()
+    connection = _connection_from_chunks([b"Content-Length: 3\r\n\r\noneContent-Length: 3\r\n\r\ntwo"])
+    buffer = bytearray()
+    assert server._read_message(connection, buffer) == b"one"  # ruff: ignore[private-member-access]  # ty: ignore[invalid-argument-type]
+    assert server._read_message(connection, buffer) == b"two"  # ruff: ignore[private-member-access]  # ty: ignore[invalid-argument-type]
+
+
+def test_read_message_rejects_missing_content_length() -> None:
+    """Ensure a frame without a 'Content-Length' header is rejected."""
+    server = DAPServer()
+    connection = _connection_from_chunks([b"X-Header: 1\r\n\r\n"])
+    with pytest.raises(RuntimeError, match="Content-Length"):
+        server._read_message(connection, bytearray())  # ruff: ignore[private-member-access]  # ty: ignore[invalid-argument-type]
+
+
+def test_read_message_returns_none_on_disconnect() -> None:
+    """Ensure a closed connection yields None instead of a partial frame."""
+    server = DAPServer()
+    connection = _connection_from_chunks([b"Content-Length: 4\r\n\r\nbo"])
+    assert server._read_message(connection, bytearray()) is None  # ruff: ignore[private-member-access]  # ty: ignore[invalid-argument-type]
+
+
 def test_code_pos_to_coordinates_handles_line_end() -> None:
     """Ensure coordinates for newline positions stay on the current line."""
     server = DAPServer()
@@ -188,6 +188,17 @@ def test_instruction_positions(simulation_instance_jumps: SimulationInstance) ->
     assert simulation_state.get_instruction_position(16) == (241, 254)
 
 
+@pytest.mark.usefixtures("simulation_state_cleanup")
+def test_instruction_positions_batch(simulation_instance_jumps: SimulationInstance) -> None:
+    """Tests the `get_instruction_positions(instructions)` method."""
+    (simulation_state, _state_id) = simulation_instance_jumps
+    # The result order must match the input order; the DAP server zips the
+    # returned positions back onto the requested instructions.
+    assert simulation_state.get_instruction_positions([0, 1, 16]) == [(0, 9), (12, 47), (241, 254)]
+    with pytest.raises(RuntimeError):
+        simulation_state.get_instruction_positions([0, 1000])
+
+
 @pytest.mark.usefixtures("simulation_state_cleanup")
 @pytest.mark.parametrize(
     "simulation_instance",